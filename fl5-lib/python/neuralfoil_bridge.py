@@ -5,22 +5,399 @@ This module provides a C++-callable interface to NeuralFoil for on-the-fly
 viscous drag calculations in 3D plane analysis.
 
 The module supports two modes:
-1. CLI mode: Run as script, read JSON from stdin, write JSON to stdout
+1. CLI mode: Run as script, read JSON lines from stdin, write JSON lines to stdout
 2. Import mode: Import and call functions directly (for testing)
 """
 
 import sys
 import os
 import json
+import math
+import hashlib
+from collections import OrderedDict
 
 # Ensure the venv site-packages are on the path
-venv_site_packages = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))), 
-                                   'venv', 'lib', 'python3.12', 'site-packages')
-if venv_site_packages not in sys.path:
-    sys.path.insert(0, venv_site_packages)
+_BASE_DIR = os.path.abspath(os.path.join(__file__, *([os.pardir] * 4)))
+VENV_SITE_PACKAGES = os.path.join(_BASE_DIR, 'venv', 'lib', 'python3.12', 'site-packages')
+if VENV_SITE_PACKAGES not in sys.path:
+    sys.path.insert(0, VENV_SITE_PACKAGES)
 
 import numpy as np
-from aerosandbox.geometry.airfoil import Airfoil
+
+# AeroSandbox (and CasADi, SciPy, NeuralFoil behind it) takes seconds to
+# import, so it is only imported when an analysis first needs it
+Airfoil = None
+
+
+def _get_airfoil_cls():
+    """
+    Get the AeroSandbox Airfoil class, importing AeroSandbox on first use.
+    
+    Returns:
+        The aerosandbox.geometry.airfoil.Airfoil class
+    """
+    global Airfoil
+    if Airfoil is None:
+        from aerosandbox.geometry.airfoil import Airfoil as _Airfoil
+        Airfoil = _Airfoil
+    return Airfoil
+
+
+# orjson is optional: it speeds up the JSON of the CLI mode, otherwise json is used.
+# Both write NaN and infinite values as null, e.g. the results at Re=0.
+try:
+    import orjson
+    _json_loads = orjson.loads
+    
+    def _json_dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:
+    _json_loads = json.loads
+    
+    def _finite_or_none(obj):
+        if isinstance(obj, float):
+            return obj if math.isfinite(obj) else None
+        if isinstance(obj, dict):
+            return {key: _finite_or_none(value) for key, value in obj.items()}
+        if isinstance(obj, (list, tuple)):
+            return [_finite_or_none(value) for value in obj]
+        return obj
+    
+    def _json_dumps(obj) -> str:
+        return json.dumps(_finite_or_none(obj), allow_nan=False)
+
+
+# NeuralFoil model used when the caller does not ask for one. Larger models are
+# more accurate but cost more per evaluation: the networks range from ~13k
+# parameters (xxsmall) through ~27k (medium), ~78k (large) and ~95k (xlarge)
+# to ~1.4M (xxxlarge). See the accuracy table in NeuralFoil's README for the
+# CL/CD error of each size before picking a smaller one. "large" is also
+# NeuralFoil's own default. Flow5 always passes the size chosen in the 3D
+# polar, so this only applies to the CLI and direct Python use.
+DEFAULT_MODEL_SIZE = "large"
+
+
+# Airfoils prepared for NeuralFoil from raw coordinates, keyed by a hash of
+# the coordinates. Flow5 analyzes the same few foils over and over, so the
+# geometry is only processed once per foil.
+AIRFOIL_CACHE_SIZE = 32
+_airfoil_cache = OrderedDict()
+
+
+def _get_foil(x_coords: list, y_coords: list) -> dict:
+    """
+    Get the NeuralFoil representation of an airfoil, reusing a cached one if available.
+    
+    NeuralFoil works on a normalized airfoil described by its Kulfan (CST)
+    parameters. Airfoil.get_aero_from_neuralfoil() normalizes the geometry and
+    fits the Kulfan parameters on every call; here this is done once per foil,
+    and the normalization is undone on the results by _infer().
+    
+    Args:
+        x_coords: X coordinates of airfoil
+        y_coords: Y coordinates of airfoil
+        
+    Returns:
+        Dictionary with keys:
+            'kulfan_airfoil': KulfanAirfoil fitted to the normalized airfoil
+            'delta_alpha': rotation applied by the normalization (degrees)
+            'scale': scale factor applied by the normalization
+            'x_translation_qc': x offset of the quarter-chord point, for Cm
+            'y_translation_qc': y offset of the quarter-chord point, for Cm
+    """
+    coords = np.empty((len(x_coords), 2))
+    coords[:, 0] = x_coords
+    coords[:, 1] = y_coords
+    key = hashlib.blake2b(coords.tobytes(), digest_size=16).digest()
+    
+    foil = _airfoil_cache.get(key)
+    if foil is not None:
+        _airfoil_cache.move_to_end(key)
+        return foil
+    
+    # Same preprocessing as Airfoil.get_aero_from_neuralfoil()
+    airfoil = _get_airfoil_cls()(name="analysis_foil", coordinates=coords)
+    normalization = airfoil.normalize(return_dict=True)
+    delta_alpha = normalization['rotation_angle']
+    scale = normalization['scale_factor']
+    foil = {
+        'kulfan_airfoil': normalization['airfoil'].to_kulfan_airfoil(
+            n_weights_per_side=8,
+            normalize_coordinates=False
+        ),
+        'delta_alpha': delta_alpha,
+        'scale': scale,
+        'x_translation_qc': -normalization['x_translation'] + 0.25 / scale * np.cos(np.radians(delta_alpha)) - 0.25,
+        'y_translation_qc': -normalization['y_translation'] - 0.25 / scale * np.sin(np.radians(delta_alpha))
+    }
+    
+    _airfoil_cache[key] = foil
+    if len(_airfoil_cache) > AIRFOIL_CACHE_SIZE:
+        _airfoil_cache.popitem(last=False)
+    return foil
+
+
+def warmup(model_size: str = DEFAULT_MODEL_SIZE):
+    """
+    Run a single NeuralFoil evaluation to pay the one-time costs up front.
+    
+    The first evaluation imports NeuralFoil and loads the network weights
+    from disk; later calls reuse them for the lifetime of the interpreter.
+    
+    Args:
+        model_size: NeuralFoil model size to evaluate
+    """
+    _get_airfoil_cls()("naca0012").get_aero_from_neuralfoil(alpha=0.0, Re=1e6, model_size=model_size)
+
+
+def _neuralfoil_options(
+    n_crit: float,
+    xtr_top: float,
+    xtr_bot: float,
+    mach: float,
+    model_size: str
+) -> dict:
+    """
+    Bundle the settings which stay constant over an analysis, for _infer().
+    
+    Args:
+        n_crit: Critical amplification factor (NCrit)
+        xtr_top: Forced transition location on top surface (0-1)
+        xtr_bot: Forced transition location on bottom surface (0-1)
+        mach: Mach number
+        model_size: NeuralFoil model size
+        
+    Returns:
+        Keyword arguments for KulfanAirfoil.get_aero_from_neuralfoil()
+    """
+    return {
+        'mach': mach,
+        'n_crit': n_crit,
+        'xtr_upper': xtr_top,
+        'xtr_lower': xtr_bot,
+        'model_size': model_size
+    }
+
+
+def _infer(
+    foil: dict,
+    alpha: np.ndarray,
+    re: np.ndarray,
+    nf_options: dict
+) -> dict:
+    """
+    Evaluate NeuralFoil on a batch of operating points.
+    
+    All NeuralFoil evaluations of this module go through here.
+    
+    Args:
+        foil: Airfoil to analyze, from _get_foil()
+        alpha: Angles of attack (degrees)
+        re: Reynolds numbers
+        nf_options: Constant NeuralFoil settings, from _neuralfoil_options()
+        
+    Returns:
+        Dictionary of NeuralFoil outputs ('CL', 'CD', 'CM', 'Top_Xtr', 'Bot_Xtr', ...)
+    """
+    # Inputs are converted to contiguous float64 arrays once, at the entry
+    # points, so that nothing gets copied again on every pass
+    assert alpha.flags['C_CONTIGUOUS'] and alpha.dtype == np.float64
+    assert re.flags['C_CONTIGUOUS'] and re.dtype == np.float64
+    
+    aero = foil['kulfan_airfoil'].get_aero_from_neuralfoil(
+        alpha=alpha + foil['delta_alpha'],
+        Re=re / foil['scale'],
+        **nf_options
+    )
+    
+    # Transfer the moment back to the quarter chord of the original airfoil
+    aero['CM'] = aero['CM'] - aero['CL'] * foil['x_translation_qc'] + aero['CD'] * foil['y_translation_qc']
+    return aero
+
+
+def _newton_update(
+    alpha: np.ndarray,
+    alpha_prev: np.ndarray,
+    cl_prev: np.ndarray,
+    alpha_lo: np.ndarray,
+    cl_lo: np.ndarray,
+    alpha_hi: np.ndarray,
+    cl_hi: np.ndarray,
+    target_cl: np.ndarray,
+    cl_result: np.ndarray,
+    idx: np.ndarray
+) -> np.ndarray:
+    """
+    Update alpha in place at the stations evaluated in the last NeuralFoil pass.
+    
+    This is a secant iteration: the Cl slope is measured from the previous
+    pass at each station, and assumed to be 0.1 per degree on the first one.
+    Once a station has iterates on both sides of its target Cl, the step is
+    taken by regula falsi between the last two bracketing iterates instead,
+    so that steep parts of the Cl curve cannot make the iteration cycle.
+    
+    Args:
+        alpha: Angles of attack (degrees) at all span stations, updated in place
+        alpha_prev: Angles of attack of the previous pass, NaN if none, updated in place
+        cl_prev: Lift coefficients of the previous pass, updated in place
+        alpha_lo: Last angles of attack with Cl below the target, NaN if none, updated in place
+        cl_lo: Lift coefficients at alpha_lo, updated in place
+        alpha_hi: Last angles of attack with Cl above the target, NaN if none, updated in place
+        cl_hi: Lift coefficients at alpha_hi, updated in place
+        target_cl: Target lift coefficients at all span stations
+        cl_result: Lift coefficients computed at the evaluated stations
+        idx: Indices of the evaluated stations
+        
+    Returns:
+        Boolean mask of the evaluated stations which have converged
+    """
+    cl_error = target_cl[idx] - cl_result
+    converged = np.abs(cl_error) < 0.001
+    
+    # Keep the slope within a sane range, so that flat or noisy parts of the
+    # Cl curve near stall do not throw the iteration off
+    d_alpha = alpha[idx] - alpha_prev[idx]
+    slope = np.where(
+        np.isnan(d_alpha),
+        0.1,
+        np.clip((cl_result - cl_prev[idx]) / (d_alpha + 1e-9), 0.05, 0.2)
+    )
+    alpha_prev[idx] = alpha[idx]
+    cl_prev[idx] = cl_result
+    
+    # Remember the last iterate on each side of the target Cl
+    below = cl_error > 0.0
+    above = cl_error < 0.0
+    alpha_lo[idx] = np.where(below, alpha[idx], alpha_lo[idx])
+    cl_lo[idx] = np.where(below, cl_result, cl_lo[idx])
+    alpha_hi[idx] = np.where(above, alpha[idx], alpha_hi[idx])
+    cl_hi[idx] = np.where(above, cl_result, cl_hi[idx])
+    
+    # Regula falsi within the bracket, slope-limited secant step otherwise
+    bracketed = ~np.isnan(alpha_lo[idx]) & ~np.isnan(alpha_hi[idx])
+    alpha_bracket = alpha_lo[idx] + (target_cl[idx] - cl_lo[idx]) * (
+        (alpha_hi[idx] - alpha_lo[idx]) / (cl_hi[idx] - cl_lo[idx])
+    )
+    alpha_new = np.where(bracketed, alpha_bracket, alpha[idx] + cl_error / slope)
+    
+    # Clamp alpha to reasonable range
+    alpha[idx] = np.where(converged, alpha[idx], np.clip(alpha_new, -20.0, 20.0))
+    return converged
+
+
+def _newton_update_loop(alpha, alpha_prev, cl_prev, alpha_lo, cl_lo, alpha_hi, cl_hi, target_cl, cl_result, idx):
+    """
+    Same as _newton_update(), written as a loop for Numba to compile.
+    """
+    converged = np.empty(idx.shape[0], dtype=np.bool_)
+    for k in range(idx.shape[0]):
+        i = idx[k]
+        cl_error = target_cl[i] - cl_result[k]
+        converged[k] = abs(cl_error) < 0.001
+        
+        if np.isnan(alpha_prev[i]):
+            slope = 0.1
+        else:
+            slope = (cl_result[k] - cl_prev[i]) / (alpha[i] - alpha_prev[i] + 1e-9)
+            slope = min(0.2, max(0.05, slope))
+        alpha_prev[i] = alpha[i]
+        cl_prev[i] = cl_result[k]
+        
+        if cl_error > 0.0:
+            alpha_lo[i] = alpha[i]
+            cl_lo[i] = cl_result[k]
+        elif cl_error < 0.0:
+            alpha_hi[i] = alpha[i]
+            cl_hi[i] = cl_result[k]
+        
+        if not converged[k]:
+            if not np.isnan(alpha_lo[i]) and not np.isnan(alpha_hi[i]):
+                alpha_new = alpha_lo[i] + (target_cl[i] - cl_lo[i]) * (
+                    (alpha_hi[i] - alpha_lo[i]) / (cl_hi[i] - cl_lo[i])
+                )
+            else:
+                alpha_new = alpha[i] + cl_error / slope
+            alpha[i] = min(20.0, max(-20.0, alpha_new))
+    return converged
+
+
+# Numba is optional: it compiles the Newton update, otherwise NumPy is used.
+# Like AeroSandbox, it is only imported when an analysis first needs it.
+_compiled_newton_update = None
+
+
+def _get_newton_update():
+    """
+    Get the Newton update function, compiling it with Numba on first use if available.
+    
+    Returns:
+        The compiled _newton_update_loop() if Numba is installed, else _newton_update()
+    """
+    global _compiled_newton_update
+    if _compiled_newton_update is None:
+        try:
+            from numba import njit
+        except ImportError:
+            _compiled_newton_update = _newton_update
+        else:
+            _compiled_newton_update = njit(cache=True)(_newton_update_loop)
+    return _compiled_newton_update
+
+
+def _seed_alpha_from_grid(
+    foil: dict,
+    target_cl: np.ndarray,
+    re: np.ndarray,
+    nf_options: dict
+) -> np.ndarray:
+    """
+    Estimate the angle of attack giving each target Cl from a coarse Cl(alpha) sweep.
+    
+    A single batched NeuralFoil call evaluates a grid of alphas for each group
+    of similar Reynolds numbers, and the rising part of each Cl(alpha) curve is
+    inverted by linear interpolation.
+    
+    Args:
+        foil: Airfoil to analyze, from _get_foil()
+        target_cl: Target lift coefficients at each span station
+        re: Reynolds numbers at each span station
+        nf_options: Constant NeuralFoil settings, from _neuralfoil_options()
+        
+    Returns:
+        Angles of attack (degrees) at each span station, NaN where the target
+        Cl is outside the pre-stall range of the sweep
+    """
+    alpha_grid = np.linspace(-10.0, 15.0, 41)
+    n_grid = len(alpha_grid)
+    
+    # Group stations by Re to within ~0.1 decade; this is only a starting
+    # point for the Newton iteration, which then runs at the exact Re
+    log_re = np.round(np.log10(re), 1)
+    log_re_unique, group = np.unique(log_re, return_inverse=True)
+    group = group.reshape(-1)
+    n_re = len(log_re_unique)
+    
+    aero = _infer(
+        foil, np.tile(alpha_grid, n_re), np.repeat(10.0 ** log_re_unique, n_grid), nf_options
+    )
+    cl_grid = np.reshape(aero['CL'], (n_re, n_grid))
+    
+    alpha_seed = np.full(len(target_cl), np.nan)
+    for k in range(n_re):
+        # Keep the rising part of the curve, from the Cl minimum up to stall
+        cl_curve = cl_grid[k]
+        i_max = int(np.argmax(cl_curve))
+        i_min = int(np.argmin(cl_curve[:i_max + 1]))
+        cl_rising = cl_curve[i_min:i_max + 1]
+        if len(cl_rising) < 2 or np.any(np.diff(cl_rising) <= 0.0):
+            continue
+        
+        stations = np.flatnonzero(group == k)
+        in_range = (target_cl[stations] >= cl_rising[0]) & (target_cl[stations] <= cl_rising[-1])
+        stations = stations[in_range]
+        alpha_seed[stations] = np.interp(target_cl[stations], cl_rising, alpha_grid[i_min:i_max + 1])
+    
+    return alpha_seed
 
 
 def analyze_foil_at_cls(
@@ -32,7 +409,7 @@ def analyze_foil_at_cls(
     xtr_top: float = 1.0,
     xtr_bot: float = 1.0,
     mach: float = 0.0,
-    model_size: str = "xlarge"
+    model_size: str = DEFAULT_MODEL_SIZE
 ) -> dict:
     """
     Analyze an airfoil at specified Cl and Re values using NeuralFoil.
@@ -49,7 +426,7 @@ def analyze_foil_at_cls(
         xtr_top: Forced transition location on top surface (0-1), default 1.0 (natural)
         xtr_bot: Forced transition location on bottom surface (0-1), default 1.0 (natural)
         mach: Mach number, default 0.0
-        model_size: NeuralFoil model size (xxsmall to xxxlarge), default "xlarge"
+        model_size: NeuralFoil model size (xxsmall to xxxlarge), default DEFAULT_MODEL_SIZE
         
     Returns:
         Dictionary with keys:
@@ -62,61 +439,95 @@ def analyze_foil_at_cls(
             'xtr_bot': list of bottom transition locations
     """
     try:
-        # Create airfoil from coordinates
-        coords = np.column_stack([x_coords, y_coords])
-        airfoil = Airfoil(name="analysis_foil", coordinates=coords)
+        # Get airfoil from coordinates (cached across calls)
+        foil = _get_foil(x_coords, y_coords)
+        nf_options = _neuralfoil_options(n_crit, xtr_top, xtr_bot, mach, model_size)
         
-        n_points = len(cl_values)
-        results = {
-            'success': True,
-            'alpha': [],
-            'cd': [],
-            'cl': [],
-            'cm': [],
-            'xtr_top': [],
-            'xtr_bot': []
-        }
+        target_cl = np.ascontiguousarray(cl_values, dtype=float)
+        re = np.ascontiguousarray(re_values, dtype=float)
+        n_points = len(target_cl)
+        
+        alpha_out = np.empty(n_points)
+        cd_out = np.empty(n_points)
+        cl_out = np.empty(n_points)
+        cm_out = np.empty(n_points)
+        xtr_top_out = np.empty(n_points)
+        xtr_bot_out = np.empty(n_points)
+        
+        # Solve for alpha at all span stations at once: each iteration makes a
+        # single batched NeuralFoil call on the stations not yet converged
+        alpha = target_cl * 10.0  # rough initial guess: ~0.1 Cl per degree
+        active = np.ones(n_points, dtype=bool)
+        
+        # Previous iterate of each station, for the secant slope
+        alpha_prev = np.full(n_points, np.nan)
+        cl_prev = np.full(n_points, np.nan)
         
-        for i in range(n_points):
-            target_cl = cl_values[i]
-            re = re_values[i]
+        # Last iterates of each station below and above its target Cl
+        alpha_lo = np.full(n_points, np.nan)
+        cl_lo = np.full(n_points, np.nan)
+        alpha_hi = np.full(n_points, np.nan)
+        cl_hi = np.full(n_points, np.nan)
+        
+        newton_update = _get_newton_update()
+        
+        # Start from an alpha sweep where it brackets the target Cl, so that
+        # most stations converge on the first pass
+        if n_points > 0:
+            alpha_seed = _seed_alpha_from_grid(
+                foil, target_cl, re, nf_options
+            )
             
-            # Use a simple iterative approach to find alpha for target Cl
-            # NeuralFoil is fast enough that this works well
-            alpha_guess = target_cl * 10.0  # rough initial guess: ~0.1 Cl per degree
+            # Span stations are ordered and Cl varies smoothly along the span, so
+            # stations the sweep could not seed start from their neighbour's alpha
+            for i in range(1, n_points):
+                cl_step = target_cl[i] - target_cl[i - 1]
+                if np.isnan(alpha_seed[i]) and not np.isnan(alpha_seed[i - 1]) and abs(cl_step) < 0.05:
+                    alpha_seed[i] = alpha_seed[i - 1] + cl_step * 10.0
             
-            for iteration in range(20):  # max iterations
-                aero = airfoil.get_aero_from_neuralfoil(
-                    alpha=alpha_guess,
-                    Re=re,
-                    mach=mach,
-                    n_crit=n_crit,
-                    xtr_upper=xtr_top,
-                    xtr_lower=xtr_bot,
-                    model_size=model_size
-                )
-                
-                cl_result = np.atleast_1d(aero['CL'])[0]
-                cl_error = target_cl - cl_result
-                
-                if abs(cl_error) < 0.001:  # converged
-                    break
-                
-                # Approximate Cl_alpha ~ 0.1 per degree
-                alpha_guess += cl_error * 10.0  # Newton-like update
-                
-                # Clamp alpha to reasonable range
-                alpha_guess = max(-20.0, min(20.0, alpha_guess))
+            alpha = np.where(np.isnan(alpha_seed), alpha, alpha_seed)
+        
+        for iteration in range(20):  # max iterations
+            idx = np.flatnonzero(active)
+            if idx.size == 0:
+                break
+            
+            aero = _infer(
+                foil, alpha[idx], re[idx], nf_options
+            )
+            
+            # Store the results of this pass; they are final for converged stations
+            alpha_out[idx] = alpha[idx]
+            cl_out[idx] = aero['CL']
+            cd_out[idx] = aero['CD']
+            cm_out[idx] = aero['CM']
+            xtr_top_out[idx] = aero['Top_Xtr']
+            xtr_bot_out[idx] = aero['Bot_Xtr']
+            
+            # Secant update of the stations not converged yet
+            converged = newton_update(
+                alpha, alpha_prev, cl_prev, alpha_lo, cl_lo, alpha_hi, cl_hi,
+                target_cl, cl_out[idx], idx
+            )
+            active[idx[converged]] = False
             
-            # Store results - ensure we get scalars from potential arrays
-            results['alpha'].append(float(alpha_guess))
-            results['cd'].append(float(np.atleast_1d(aero['CD'])[0]))
-            results['cl'].append(float(np.atleast_1d(aero['CL'])[0]))
-            results['cm'].append(float(np.atleast_1d(aero['CM'])[0]))
-            results['xtr_top'].append(float(np.atleast_1d(aero['Top_Xtr'])[0]))
-            results['xtr_bot'].append(float(np.atleast_1d(aero['Bot_Xtr'])[0]))
+            # A station held at the alpha clamp would be evaluated at the same
+            # alpha again, and one with non-finite results (e.g. Re=0) can never
+            # converge; keep the results already stored at the last alpha instead
+            stuck = ~converged & (
+                (alpha[idx] == alpha_out[idx]) | ~np.isfinite(cl_out[idx])
+            )
+            active[idx[stuck]] = False
         
-        return results
+        return {
+            'success': True,
+            'alpha': alpha_out.tolist(),
+            'cd': cd_out.tolist(),
+            'cl': cl_out.tolist(),
+            'cm': cm_out.tolist(),
+            'xtr_top': xtr_top_out.tolist(),
+            'xtr_bot': xtr_bot_out.tolist()
+        }
         
     except Exception as e:
         return {
@@ -142,7 +553,7 @@ def generate_polar_vectorized(
     xtr_top: float = 1.0,
     xtr_bot: float = 1.0,
     mach: float = 0.0,
-    model_size: str = "xlarge"
+    model_size: str = DEFAULT_MODEL_SIZE
 ) -> dict:
     """
     Generate polar data at multiple Reynolds numbers using vectorized NeuralFoil.
@@ -171,38 +582,44 @@ def generate_polar_vectorized(
             'error': str (if failed)
     """
     try:
-        # Create airfoil from coordinates
-        coords = np.column_stack([x_coords, y_coords])
-        airfoil = Airfoil(name="polar_foil", coordinates=coords)
+        # Get airfoil from coordinates (cached across calls)
+        foil = _get_foil(x_coords, y_coords)
+        nf_options = _neuralfoil_options(n_crit, xtr_top, xtr_bot, mach, model_size)
         
         # Create alpha array
         alphas = np.arange(alpha_min, alpha_max + alpha_step/2, alpha_step)
         n_alphas = len(alphas)
         
+        re_array = np.ascontiguousarray(re_values, dtype=float)
+        n_re = len(re_array)
+        
         polars = {}
         
-        for re in re_values:
-            # Single vectorized call per Re with all alphas at once!
-            # This is the key speedup - NeuralFoil processes entire alpha array
-            aero = airfoil.get_aero_from_neuralfoil(
-                alpha=alphas,
-                Re=float(re),
-                mach=mach,
-                n_crit=n_crit,
-                xtr_upper=xtr_top,
-                xtr_lower=xtr_bot,
-                model_size=model_size
+        if n_re > 0:
+            # Single vectorized call for all (alpha, Re) pairs at once!
+            # This is the key speedup - NeuralFoil processes the entire batch
+            aero = _infer(
+                foil, np.tile(alphas, n_re), np.repeat(re_array, n_alphas), nf_options
             )
             
-            # Store results for this Re
-            polars[float(re)] = {
-                'alpha': alphas.tolist(),
-                'cl': aero['CL'].tolist() if isinstance(aero['CL'], np.ndarray) else [float(aero['CL'])],
-                'cd': aero['CD'].tolist() if isinstance(aero['CD'], np.ndarray) else [float(aero['CD'])],
-                'cm': aero['CM'].tolist() if isinstance(aero['CM'], np.ndarray) else [float(aero['CM'])],
-                'xtr_top': aero['Top_Xtr'].tolist() if isinstance(aero['Top_Xtr'], np.ndarray) else [float(aero['Top_Xtr'])],
-                'xtr_bot': aero['Bot_Xtr'].tolist() if isinstance(aero['Bot_Xtr'], np.ndarray) else [float(aero['Bot_Xtr'])]
-            }
+            # One row per Re
+            cl = np.reshape(aero['CL'], (n_re, n_alphas))
+            cd = np.reshape(aero['CD'], (n_re, n_alphas))
+            cm = np.reshape(aero['CM'], (n_re, n_alphas))
+            xtr_top_res = np.reshape(aero['Top_Xtr'], (n_re, n_alphas))
+            xtr_bot_res = np.reshape(aero['Bot_Xtr'], (n_re, n_alphas))
+            
+            # Store results for each Re
+            alpha_list = alphas.tolist()
+            for k, re in enumerate(re_array.tolist()):
+                polars[re] = {
+                    'alpha': alpha_list,
+                    'cl': cl[k].tolist(),
+                    'cd': cd[k].tolist(),
+                    'cm': cm[k].tolist(),
+                    'xtr_top': xtr_top_res[k].tolist(),
+                    'xtr_bot': xtr_bot_res[k].tolist()
+                }
         
         return {
             'success': True,
@@ -228,7 +645,8 @@ def analyze_foil_at_alphas(
     xtr_top: float = 1.0,
     xtr_bot: float = 1.0,
     mach: float = 0.0,
-    model_size: str = "xlarge"
+    model_size: str = DEFAULT_MODEL_SIZE,
+    dedup: bool = False
 ) -> dict:
     """
     Analyze an airfoil at specified alpha and Re values using NeuralFoil.
@@ -243,37 +661,51 @@ def analyze_foil_at_alphas(
         xtr_bot: Forced transition location on bottom surface (0-1)
         mach: Mach number
         model_size: NeuralFoil model size
+        dedup: If True, round alpha to 0.01 degree and log10(Re) to 0.001, and
+            evaluate NeuralFoil once per distinct rounded operating point; each
+            station is evaluated within 0.005 degree in alpha and 0.115% in Re
+            of its own operating point
         
     Returns:
         Dictionary with aerodynamic results
     """
     try:
-        coords = np.column_stack([x_coords, y_coords])
-        airfoil = Airfoil(name="analysis_foil", coordinates=coords)
+        foil = _get_foil(x_coords, y_coords)
+        nf_options = _neuralfoil_options(n_crit, xtr_top, xtr_bot, mach, model_size)
         
         # NeuralFoil can handle batched inputs
-        alphas = np.array(alpha_values)
-        res = np.array(re_values)
-        
-        aero = airfoil.get_aero_from_neuralfoil(
-            alpha=alphas,
-            Re=res,
-            mach=mach,
-            n_crit=n_crit,
-            xtr_upper=xtr_top,
-            xtr_lower=xtr_bot,
-            model_size=model_size
-        )
+        alphas = np.ascontiguousarray(alpha_values, dtype=float)
+        res = np.ascontiguousarray(re_values, dtype=float)
+        
+        if dedup:
+            # Round alpha and log(Re) to find the duplicate operating points,
+            # evaluate each rounded point once, and scatter the results back
+            alphas_b, res_b = np.broadcast_arrays(np.ravel(alphas), np.ravel(res))
+            points = np.stack([np.round(alphas_b, 2), np.round(np.log10(res_b), 3)], axis=1)
+            points_unique, inverse = np.unique(points, axis=0, return_inverse=True)
+            inverse = inverse.reshape(-1)
+            
+            aero = _infer(
+                foil,
+                np.ascontiguousarray(points_unique[:, 0]),
+                np.ascontiguousarray(10.0 ** points_unique[:, 1]),
+                nf_options
+            )
+            aero = {key: np.ravel(aero[key])[inverse] for key in ('CL', 'CD', 'CM', 'Top_Xtr', 'Bot_Xtr')}
+        else:
+            aero = _infer(
+                foil, alphas, res, nf_options
+            )
         
         # Convert to Python lists for C++ compatibility
         return {
             'success': True,
-            'alpha': alphas.tolist() if isinstance(alphas, np.ndarray) else [alphas],
-            'cd': aero['CD'].tolist() if isinstance(aero['CD'], np.ndarray) else [float(aero['CD'])],
-            'cl': aero['CL'].tolist() if isinstance(aero['CL'], np.ndarray) else [float(aero['CL'])],
-            'cm': aero['CM'].tolist() if isinstance(aero['CM'], np.ndarray) else [float(aero['CM'])],
-            'xtr_top': aero['Top_Xtr'].tolist() if isinstance(aero['Top_Xtr'], np.ndarray) else [float(aero['Top_Xtr'])],
-            'xtr_bot': aero['Bot_Xtr'].tolist() if isinstance(aero['Bot_Xtr'], np.ndarray) else [float(aero['Bot_Xtr'])]
+            'alpha': np.ravel(alphas).tolist(),
+            'cd': np.ravel(aero['CD']).tolist(),
+            'cl': np.ravel(aero['CL']).tolist(),
+            'cm': np.ravel(aero['CM']).tolist(),
+            'xtr_top': np.ravel(aero['Top_Xtr']).tolist(),
+            'xtr_bot': np.ravel(aero['Bot_Xtr']).tolist()
         }
         
     except Exception as e:
@@ -291,56 +723,72 @@ def analyze_foil_at_alphas(
 
 def run_cli_mode():
     """
-    CLI mode: Read JSON input from stdin, process, write JSON output to stdout.
+    CLI mode: Serve JSON requests from stdin, write JSON results to stdout.
     
     This is the main entry point when called as a subprocess from C++.
+    The process stays alive between requests so that interpreter startup,
+    imports and NeuralFoil weight loading are paid only once. Each line of
+    stdin holds one request, and one line of JSON is written back per
+    request. A request of {"shutdown": true}, or closing stdin, ends the loop.
     """
+    # Load AeroSandbox, NeuralFoil and its weights before the first request
     try:
-        # Read JSON input from stdin
-        input_data = sys.stdin.read()
-        input_json = json.loads(input_data)
-        
-        # Extract parameters
-        x_coords = input_json['x_coords']
-        y_coords = input_json['y_coords']
-        cl_values = input_json['cl_values']
-        re_values = input_json['re_values']
-        n_crit = input_json.get('n_crit', 9.0)
-        xtr_top = input_json.get('xtr_top', 1.0)
-        xtr_bot = input_json.get('xtr_bot', 1.0)
-        mach = input_json.get('mach', 0.0)
-        model_size = input_json.get('model_size', 'xlarge')
-        
-        # Run analysis
-        result = analyze_foil_at_cls(
-            x_coords=x_coords,
-            y_coords=y_coords,
-            cl_values=cl_values,
-            re_values=re_values,
-            n_crit=n_crit,
-            xtr_top=xtr_top,
-            xtr_bot=xtr_bot,
-            mach=mach,
-            model_size=model_size
-        )
+        warmup()
+    except Exception as e:
+        print(f"[neuralfoil_bridge] Warmup failed: {e}", file=sys.stderr)
+    
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
         
-        # Write JSON output to stdout
-        print(json.dumps(result), flush=True)
-        sys.exit(0)
+        try:
+            input_json = _json_loads(line)
+            
+            if input_json.get('shutdown', False):
+                break
+            
+            # Extract parameters
+            x_coords = input_json['x_coords']
+            y_coords = input_json['y_coords']
+            cl_values = input_json['cl_values']
+            re_values = input_json['re_values']
+            n_crit = input_json.get('n_crit', 9.0)
+            xtr_top = input_json.get('xtr_top', 1.0)
+            xtr_bot = input_json.get('xtr_bot', 1.0)
+            mach = input_json.get('mach', 0.0)
+            model_size = input_json.get('model_size', DEFAULT_MODEL_SIZE)
+            
+            # Run analysis
+            result = analyze_foil_at_cls(
+                x_coords=x_coords,
+                y_coords=y_coords,
+                cl_values=cl_values,
+                re_values=re_values,
+                n_crit=n_crit,
+                xtr_top=xtr_top,
+                xtr_bot=xtr_bot,
+                mach=mach,
+                model_size=model_size
+            )
+            
+        except Exception as e:
+            result = {
+                'success': False,
+                'error': f"CLI mode error: {str(e)}",
+                'alpha': [],
+                'cd': [],
+                'cl': [],
+                'cm': [],
+                'xtr_top': [],
+                'xtr_bot': []
+            }
         
-    except Exception as e:
-        error_result = {
-            'success': False,
-            'error': f"CLI mode error: {str(e)}",
-            'alpha': [],
-            'cd': [],
-            'cl': [],
-            'cm': [],
-            'xtr_top': [],
-            'xtr_bot': []
-        }
-        print(json.dumps(error_result), flush=True)
-        sys.exit(1)
+        # Write JSON output to stdout, one line per request
+        sys.stdout.write(_json_dumps(result) + "\n")
+        sys.stdout.flush()
+    
+    sys.exit(0)
 
 
 # CLI mode entry point
@@ -349,8 +797,7 @@ if __name__ == "__main__":
         run_cli_mode()
     else:
         # Test mode - run a simple test
-        from aerosandbox.geometry.airfoil import Airfoil as ASB_Airfoil
-        naca0012 = ASB_Airfoil("naca0012")
+        naca0012 = _get_airfoil_cls()("naca0012")
         x = naca0012.x().tolist()
         y = naca0012.y().tolist()
         
@@ -367,3 +814,19 @@ if __name__ == "__main__":
         for i in range(3):
             print(f"  Target Cl={[0.5, 0.6, 0.7][i]:.3f} -> alpha={result['alpha'][i]:.3f}°, "
                   f"Cl={result['cl'][i]:.4f}, Cd={result['cd'][i]:.5f}")
+
+        # High-lift stations that used to 2-cycle around their target
+        s1223 = _get_airfoil_cls()("s1223")
+        cl_targets = [0.8, 0.75, 0.7, 0.85]
+        result = analyze_foil_at_cls(
+            x_coords=s1223.x().tolist(),
+            y_coords=s1223.y().tolist(),
+            cl_values=cl_targets,
+            re_values=[2e5, 2e5, 3e5, 2e5],
+            model_size="large"
+        )
+
+        print("s1223 convergence check:")
+        for target, alpha, cl in zip(cl_targets, result['alpha'], result['cl']):
+            print(f"  Target Cl={target:.3f} -> alpha={alpha:.3f}°, Cl={cl:.4f}")
+            assert abs(cl - target) < 0.001, f"s1223 did not converge to Cl={target}"